@@ -3,6 +3,8 @@
 __version__ = "0.4.8"
 
 from .config import (
+    clear_editorconfig_cache,
+    current_file,
     get_current_file,
     get_indent_config,
     set_current_file,
@@ -14,6 +16,8 @@ __all__ = [
     "RENDERERS",
     "update_mdit",
     "set_current_file",
+    "current_file",
     "get_current_file",
     "get_indent_config",
+    "clear_editorconfig_cache",
 ]
@@ -2,16 +2,37 @@
 
 This module provides functions to track the current file being formatted
 and retrieve indentation settings from .editorconfig files.
+
+Parsed .editorconfig files are cached per directory and revalidated against
+the file's mtime and size, so formatting many files in the same tree only
+parses each .editorconfig once.
 """
 
+import functools
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 from pathlib import Path
 
-import editorconfig
-
 # Thread-safe context variable to track the current file being formatted
 _current_file: ContextVar[Path | None] = ContextVar("current_file", default=None)
 
+# Parsed .editorconfig contents: (is_root, [(section_glob, options), ...])
+_ParsedConfig = tuple[bool, list[tuple[str, dict[str, str]]]]
+
+# The only EditorConfig properties this plugin reads
+_INDENT_KEYS = ("indent_style", "indent_size", "tab_width")
+
+# Numeric range brace group in section globs, e.g. {1..3}
+_NUM_RANGE_RE = re.compile(r"([+-]?\d+)\.\.([+-]?\d+)")
+
+# .editorconfig line syntax: section headers (unescaped "#" and ";" end the
+# header), "key = value" or "key: value" options, and inline comments
+_SECTION_RE = re.compile(r"\[((?:[^#;]|\\#|\\;)+)\]")
+_OPTION_RE = re.compile(r"([^:=\s][^:=]*?)\s*[:=]\s*(.*)$")
+_INLINE_COMMENT_RE = re.compile(r"\s[;#]")
+
 
 def set_current_file(filepath: Path | str | None) -> None:
     """Set the current file being formatted (for editorconfig lookup).
@@ -25,6 +46,25 @@ def set_current_file(filepath: Path | str | None) -> None:
         _current_file.set(Path(filepath).resolve())
 
 
+@contextmanager
+def current_file(filepath: Path | str | None) -> Iterator[None]:
+    """Set the current file for the duration of a with block.
+
+    The previous value is restored on exit, so nested and concurrent
+    (per-thread or per-task) uses do not interfere with each other.
+
+    Args:
+        filepath: Path to the file being formatted, or None.
+    """
+    if filepath is not None:
+        filepath = Path(filepath).resolve()
+    token = _current_file.set(filepath)
+    try:
+        yield
+    finally:
+        _current_file.reset(token)
+
+
 def get_current_file() -> Path | None:
     """Get the current file being formatted.
 
@@ -34,6 +74,304 @@ def get_current_file() -> Path | None:
     return _current_file.get()
 
 
+def clear_editorconfig_cache() -> None:
+    """Discard all cached .editorconfig parse results."""
+    _editorconfig_cache.clear()
+
+
+def _parse_editorconfig(text: str) -> _ParsedConfig:
+    """Parse the contents of an .editorconfig file.
+
+    Sections are kept in file order, including repeated section headers, so
+    later sections override earlier ones as the EditorConfig spec requires.
+    Only the indentation properties are kept.
+
+    Returns:
+        Tuple of (is_root, sections) where sections is a list of
+        (glob, options) pairs in file order.
+    """
+    is_root = False
+    sections: list[tuple[str, dict[str, str]]] = []
+    options: dict[str, str] | None = None  # None until the first section
+
+    for line in text.lstrip("\ufeff").splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        header = _SECTION_RE.match(line)
+        if header:
+            options = {}
+            sections.append((header.group(1), options))
+            continue
+
+        option = _OPTION_RE.match(line)
+        if not option:
+            # Ignore malformed lines
+            continue
+        key, value = option.group(1).lower(), option.group(2)
+        # ";" and "#" start a comment only when preceded by whitespace
+        comment = _INLINE_COMMENT_RE.search(value)
+        if comment:
+            value = value[: comment.start()]
+        value = value.strip()
+        if value == '""':
+            value = ""
+
+        if options is None:
+            if key == "root":
+                is_root = value.lower() == "true"
+        elif key in _INDENT_KEYS:
+            options[key] = value
+
+    return (is_root, [(glob, opts) for glob, opts in sections if opts])
+
+
+class _EditorConfigCache:
+    """Per-directory cache of parsed .editorconfig files.
+
+    All state lives on the instance, so each process (e.g. each pytest-xdist
+    worker) holds its own independent cache.
+    """
+
+    def __init__(self) -> None:
+        # Parsed configs keyed by directory, with the (st_mtime_ns, st_size)
+        # stamp of the file each was parsed from
+        self.configs: dict[Path, tuple[tuple[int, int], _ParsedConfig]] = {}
+
+    def clear(self) -> None:
+        """Discard all cached results."""
+        self.configs.clear()
+
+    def load(self, directory: Path) -> _ParsedConfig | None:
+        """Load the .editorconfig in a directory, using the cache when fresh.
+
+        Returns:
+            The parsed config, or None if the directory has no .editorconfig.
+        """
+        path = directory / ".editorconfig"
+        try:
+            stat = path.stat()
+        except OSError:
+            self.configs.pop(directory, None)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.configs.get(directory)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            parsed = _parse_editorconfig(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError):
+            # Treat unreadable files as empty
+            parsed = (False, [])
+
+        self.configs[directory] = (stamp, parsed)
+        return parsed
+
+
+_editorconfig_cache = _EditorConfigCache()
+
+
+def _find_closing_brace(glob: str, start: int) -> int:
+    """Return the index of the "}" matching the "{" at glob[start], or -1."""
+    depth = 0
+    i = start
+    while i < len(glob):
+        c = glob[i]
+        if c == "\\":
+            i += 1
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+
+def _split_alternatives(inner: str) -> list[str]:
+    """Split the contents of a brace group on its top-level commas."""
+    parts = []
+    depth = 0
+    last = 0
+    i = 0
+    while i < len(inner):
+        c = inner[i]
+        if c == "\\":
+            i += 1
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(inner[last:i])
+            last = i + 1
+        i += 1
+    parts.append(inner[last:])
+    return parts
+
+
+def _translate_glob(glob: str, ranges: list[tuple[int, int]]) -> str:
+    """Translate an EditorConfig section glob into a regex string.
+
+    Supports ``*`` (any characters except ``/``), ``**`` (any characters),
+    ``?``, ``[...]``/``[!...]`` character classes, ``{a,b}`` alternatives
+    (which may nest), ``{n1..n2}`` integer ranges, and backslash escapes.
+
+    Each integer range becomes a capturing group matching any integer; its
+    (low, high) bounds are appended to ranges in group order so the caller
+    can check captured values after a match.
+    """
+    out = []
+    i = 0
+    n = len(glob)
+    while i < n:
+        c = glob[i]
+        i += 1
+        if c == "\\" and i < n:
+            out.append(re.escape(glob[i]))
+            i += 1
+        elif c == "*":
+            if i < n and glob[i] == "*":
+                i += 1
+                if i < n and glob[i] == "/":
+                    # "**/" also matches zero directories
+                    i += 1
+                    out.append("(?:.*/)?")
+                else:
+                    out.append(".*")
+            else:
+                out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = glob.find("]", i)
+            chars = glob[i:end]
+            if end == -1 or not chars or "/" in chars:
+                out.append(re.escape(c))
+                continue
+            negate = chars.startswith("!")
+            if negate:
+                chars = chars[1:]
+            chars = chars.replace("\\", "\\\\")
+            # Escape characters that re treats as nested-set syntax
+            for special in "[&~|":
+                chars = chars.replace(special, "\\" + special)
+            chars = chars.replace("--", "-\\-")
+            out.append(f"[^{chars}]" if negate else f"[{chars}]")
+            i = end + 1
+        elif c == "{":
+            end = _find_closing_brace(glob, i - 1)
+            if end == -1:
+                out.append(re.escape(c))
+                continue
+            inner = glob[i:end]
+            i = end + 1
+            num_range = _NUM_RANGE_RE.fullmatch(inner)
+            if num_range:
+                lo, hi = sorted(int(x) for x in num_range.groups())
+                ranges.append((lo, hi))
+                out.append(r"([+-]?\d+)")
+                continue
+            alternatives = _split_alternatives(inner)
+            if len(alternatives) == 1:
+                # A brace group without commas is literal
+                out.append(
+                    re.escape("{") + _translate_glob(inner, ranges) + re.escape("}")
+                )
+            else:
+                out.append(
+                    "(?:"
+                    + "|".join(_translate_glob(alt, ranges) for alt in alternatives)
+                    + ")"
+                )
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_re(
+    glob: str,
+) -> tuple[re.Pattern[str] | None, tuple[tuple[int, int], ...]]:
+    """Compile an EditorConfig section glob, once per unique glob.
+
+    Returns:
+        Tuple of (pattern, ranges) where ranges holds the (low, high) bounds
+        of each integer range group in the pattern, in group order. pattern
+        is None if the glob is invalid (e.g. a reversed range like [z-a]).
+    """
+    ranges: list[tuple[int, int]] = []
+    try:
+        pattern = re.compile(_translate_glob(glob, ranges))
+    except re.error:
+        return (None, ())
+    return (pattern, tuple(ranges))
+
+
+def _section_matches(glob: str, directory: Path, filepath: Path) -> bool:
+    """Check whether a section glob from directory/.editorconfig matches filepath."""
+    if "/" in glob:
+        # Globs containing a slash are relative to the .editorconfig directory
+        try:
+            target = filepath.relative_to(directory).as_posix()
+        except ValueError:
+            return False
+        glob = glob.removeprefix("/")
+    else:
+        # Globs without a slash match the file name at any depth
+        target = filepath.name
+    pattern, ranges = _glob_re(glob)
+    if pattern is None:
+        # Invalid section globs never match
+        return False
+    match = pattern.fullmatch(target)
+    if match is None:
+        return False
+    # Integer range groups match any integer; check the bounds here
+    return all(
+        value is None or lo <= int(value) <= hi
+        for value, (lo, hi) in zip(match.groups(), ranges)
+    )
+
+
+def _get_properties(filepath: Path) -> dict[str, str]:
+    """Get the EditorConfig properties that apply to a file.
+
+    Walks up from the file's directory collecting .editorconfig files until
+    one declares ``root = true``, then applies matching sections from the
+    outermost file inwards so that closer files take precedence.
+    """
+    configs = []
+    for directory in filepath.parents:
+        parsed = _editorconfig_cache.load(directory)
+        if parsed is None:
+            continue
+        is_root, sections = parsed
+        configs.append((directory, sections))
+        if is_root:
+            break
+
+    props: dict[str, str] = {}
+    for directory, sections in reversed(configs):
+        for glob, options in sections:
+            if _section_matches(glob, directory, filepath):
+                props.update(options)
+
+    for name in ("indent_style", "indent_size"):
+        if name in props:
+            props[name] = props[name].lower()
+
+    # Per the EditorConfig spec, indent_style = tab implies indent_size = tab
+    if props.get("indent_style") == "tab" and "indent_size" not in props:
+        props["indent_size"] = "tab"
+
+    return props
+
+
 def get_indent_config() -> tuple[str, int] | None:
     """Get indent configuration from .editorconfig for the current file.
 
@@ -61,10 +399,7 @@ def get_indent_config() -> tuple[str, int] | None:
     if filepath is None:
         filepath = Path.cwd() / "_.md"
 
-    try:
-        props = editorconfig.get_properties(str(filepath))
-    except editorconfig.EditorConfigError:
-        props = {}
+    props = _get_properties(filepath)
 
     indent_style = props.get("indent_style")
     indent_size = props.get("indent_size")
@@ -74,13 +409,10 @@ def get_indent_config() -> tuple[str, int] | None:
     if not indent_style and not indent_size and not explicit_file_set:
         home_editorconfig = Path.home() / ".editorconfig"
         if home_editorconfig.exists():
-            try:
-                # Use a synthetic .md file in HOME for the lookup
-                home_props = editorconfig.get_properties(str(Path.home() / "_.md"))
-                indent_style = home_props.get("indent_style")
-                indent_size = home_props.get("indent_size")
-            except editorconfig.EditorConfigError:
-                pass
+            # Use a synthetic .md file in HOME for the lookup
+            props = _get_properties(Path.home() / "_.md")
+            indent_style = props.get("indent_style")
+            indent_size = props.get("indent_size")
 
     # If still neither property is set, return None (passthrough)
     if not indent_style and not indent_size:
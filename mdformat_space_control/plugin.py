@@ -9,8 +9,9 @@ Provides custom renderers that combine:
 - Wikilink preservation ([[link]] and ![[embed]] syntax)
 """
 
+import itertools
 import re
-from typing import Mapping
+from typing import Iterable, Mapping
 
 from markdown_it import MarkdownIt
 from markdown_it.rules_inline import StateInline
@@ -90,18 +91,43 @@ def list_has_loose_items(list_node: RenderTreeNode) -> bool:
     return False
 
 
-def _get_indent(default_width: int) -> tuple[str, int]:
+# Keys for per-render state stored in the render context env (a fresh env
+# is created for every render, so nothing leaks between documents)
+_ENV_INDENT_CONFIG = "space_control_indent_config"
+_ENV_LOOSE_LISTS = "space_control_loose_lists"
+
+
+def _is_loose_list(list_node: RenderTreeNode, context: RenderContext) -> bool:
+    """Check if a list has loose items, computing it once per list per render.
+
+    Both the list renderer and each of its list items need this; caching it
+    avoids rescanning every sibling item for every item.
+    """
+    loose_lists = context.env.setdefault(_ENV_LOOSE_LISTS, {})
+    key = id(list_node)
+    if key not in loose_lists:
+        loose_lists[key] = list_has_loose_items(list_node)
+    return loose_lists[key]
+
+
+def _get_indent(default_width: int, context: RenderContext) -> tuple[str, int]:
     """Get the indentation string and width based on editorconfig.
 
+    The editorconfig lookup happens once per render and is shared by all
+    lists in the document.
+
     Args:
         default_width: The default indent width (from marker length).
+        context: The current render context.
 
     Returns:
         Tuple of (indent_string, indent_width) where:
         - indent_string: The string to use for indentation
         - indent_width: The width in columns (for context.indented)
     """
-    config = get_indent_config()
+    if _ENV_INDENT_CONFIG not in context.env:
+        context.env[_ENV_INDENT_CONFIG] = get_indent_config()
+    config = context.env[_ENV_INDENT_CONFIG]
     if config is None:
         # No editorconfig - use default (passthrough behavior)
         return (" " * default_width, default_width)
@@ -169,7 +195,7 @@ def _render_list_item(node: RenderTreeNode, context: RenderContext) -> str:
     else:
         # Check if we're in a loose list (any item has multiple paragraphs)
         parent = node.parent
-        if parent and list_has_loose_items(parent):
+        if parent and _is_loose_list(parent, context):
             # Even single paragraph items get loose formatting in a loose list
             block_separator = "\n\n"
         else:
@@ -190,82 +216,70 @@ def _render_list_item(node: RenderTreeNode, context: RenderContext) -> str:
     return text
 
 
-def _render_bullet_list(node: RenderTreeNode, context: RenderContext) -> str:
-    """Render bullet list with configurable indentation and tight formatting."""
-    marker_type = get_list_marker_type(node)
+def _render_list_items(
+    node: RenderTreeNode,
+    context: RenderContext,
+    markers: Iterable[str],
+    default_indent_width: int,
+) -> str:
+    """Render the items of a list in a single pass.
+
+    Indentation and tight/loose spacing are resolved once for the list, then
+    each item is rendered, prefixed with its marker, and indented as it is
+    emitted.
+
+    Args:
+        node: The bullet_list or ordered_list node.
+        context: The current render context.
+        markers: The marker for each item, in order.
+        default_indent_width: Indent width to use without editorconfig.
+    """
     first_line_indent = " "
-    default_indent_width = len(marker_type + first_line_indent)
 
     # Get configurable indent from editorconfig
-    indent_str, indent_width = _get_indent(default_indent_width)
+    indent_str, indent_width = _get_indent(default_indent_width, context)
 
     # Determine tight/loose based on multi-paragraph items
-    is_loose = list_has_loose_items(node)
-    block_separator = "\n\n" if is_loose else "\n"
+    block_separator = "\n\n" if _is_loose_list(node, context) else "\n"
 
+    items = []
     with context.indented(indent_width):
-        text = ""
-        for child_idx, child in enumerate(node.children):
+        for marker, child in zip(markers, node.children):
             list_item = child.render(context)
-            formatted_lines = []
-            line_iterator = iter(list_item.split("\n"))
-            first_line = next(line_iterator, "")
-            formatted_lines.append(
-                f"{marker_type}{first_line_indent}{first_line}"
-                if first_line
-                else marker_type
-            )
-            for line in line_iterator:
-                formatted_lines.append(f"{indent_str}{line}" if line else "")
-            text += "\n".join(formatted_lines)
-            if child_idx < len(node.children) - 1:
-                text += block_separator
-    return text
+            first_line, newline, rest = list_item.partition("\n")
+            formatted_lines = [
+                f"{marker}{first_line_indent}{first_line}" if first_line else marker
+            ]
+            if newline:
+                formatted_lines.extend(
+                    f"{indent_str}{line}" if line else "" for line in rest.split("\n")
+                )
+            items.append("\n".join(formatted_lines))
+    return block_separator.join(items)
+
+
+def _render_bullet_list(node: RenderTreeNode, context: RenderContext) -> str:
+    """Render bullet list with configurable indentation and tight formatting."""
+    marker_type = get_list_marker_type(node)
+    default_indent_width = len(marker_type + " ")
+    return _render_list_items(
+        node, context, itertools.repeat(marker_type), default_indent_width
+    )
 
 
 def _render_ordered_list(node: RenderTreeNode, context: RenderContext) -> str:
     """Render ordered list with configurable indentation and tight formatting."""
-    first_line_indent = " "
     list_len = len(node.children)
     starting_number = node.attrs.get("start")
     if starting_number is None:
         starting_number = 1
     assert isinstance(starting_number, int)
 
-    # Determine tight/loose based on multi-paragraph items
-    is_loose = list_has_loose_items(node)
-    block_separator = "\n\n" if is_loose else "\n"
-
     # Calculate default indent width based on longest marker
-    longest_marker_len = len(
-        str(starting_number + list_len - 1) + "." + first_line_indent
-    )
-
-    # Get configurable indent from editorconfig
-    indent_str, indent_width = _get_indent(longest_marker_len)
+    longest_marker_len = len(str(starting_number + list_len - 1) + ". ")
 
-    with context.indented(indent_width):
-        text = ""
-        for child_idx, child in enumerate(node.children):
-            list_marker = f"{starting_number + child_idx}."
-
-            list_item = child.render(context)
-            formatted_lines = []
-            line_iterator = iter(list_item.split("\n"))
-            first_line = next(line_iterator, "")
-            formatted_lines.append(
-                f"{list_marker}{first_line_indent}{first_line}"
-                if first_line
-                else list_marker
-            )
-
-            for line in line_iterator:
-                formatted_lines.append(f"{indent_str}{line}" if line else "")
-
-            text += "\n".join(formatted_lines)
-            if child_idx < len(node.children) - 1:
-                text += block_separator
-    return text
+    markers = (f"{starting_number + i}." for i in range(list_len))
+    return _render_list_items(node, context, markers, longest_marker_len)
 
 
 def _render_wikilink(node: RenderTreeNode, context: RenderContext) -> str:
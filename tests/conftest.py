@@ -0,0 +1,34 @@
+"""Shared pytest configuration for mdformat-space-control tests."""
+
+import mdformat
+import mdformat.plugins
+import pytest
+
+import mdformat_space_control
+from mdformat_space_control import clear_editorconfig_cache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _register_space_control():
+    """Resolve the space_control extension to the imported package.
+
+    mdformat scans entry points once per process; pinning the registry entry
+    to the module under test makes every ``mdformat.text`` call use it
+    directly, even when the installed entry point is stale or missing.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(
+            mdformat.plugins.PARSER_EXTENSIONS, "space_control", mdformat_space_control
+        )
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_mdformat(_register_space_control):
+    """Format once at session start so lazy mdformat setup isn't billed to a test."""
+    extensions = {"space_control"}
+    if "frontmatter" in mdformat.plugins.PARSER_EXTENSIONS:
+        extensions.add("frontmatter")
+    mdformat.text("warmup\n", extensions=extensions)
+    # Don't let the warmup's cwd-based lookup leak cached state into tests
+    clear_editorconfig_cache()
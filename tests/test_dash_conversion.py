@@ -4,6 +4,10 @@ import mdformat
 import pytest
 
 
+_EXT = frozenset({"space_control"})
+_EXT_FM = frozenset({"space_control", "frontmatter"})
+
+
 class TestDashConversionBasic:
     """Tests for basic dash sequence conversion."""
 
@@ -11,56 +15,56 @@ class TestDashConversionBasic:
         """Triple dashes should convert to em-dash."""
         input_text = "word---word\n"
         expected = "word\u2014word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_en_dash_conversion(self):
         """Double dashes should convert to en-dash."""
         input_text = "word--word\n"
         expected = "word\u2013word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_em_dash_with_spaces(self):
         """Em-dash with surrounding spaces."""
         input_text = "word --- word\n"
         expected = "word \u2014 word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_en_dash_with_spaces(self):
         """En-dash with surrounding spaces."""
         input_text = "word -- word\n"
         expected = "word \u2013 word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_mixed_dashes(self):
         """Both em-dash and en-dash in same line."""
         input_text = "first--second---third\n"
         expected = "first\u2013second\u2014third\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_multiple_en_dashes(self):
         """Multiple en-dashes in same line."""
         input_text = "a--b and c--d\n"
         expected = "a\u2013b and c\u2013d\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_em_dash_in_sentence(self):
         """Em-dash used in a typical sentence."""
         input_text = "The result---unexpected as it was---changed everything.\n"
         expected = "The result\u2014unexpected as it was\u2014changed everything.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_en_dash_range(self):
         """En-dash used for a numeric range."""
         input_text = "Pages 10--20\n"
         expected = "Pages 10\u201320\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -71,7 +75,7 @@ class TestDashConversionPreserved:
         """Dashes inside backtick-fenced code blocks should be preserved."""
         input_text = "Text.\n\n```\na--b and c---d\n```\n"
         expected = "Text.\n\n```\na--b and c---d\n```\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_fenced_code_block_tildes(self):
@@ -81,14 +85,14 @@ class TestDashConversionPreserved:
         """
         input_text = "Text.\n\n~~~\na--b\n~~~\n"
         expected = "Text.\n\n```\na--b\n```\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_inline_code_preserved(self):
         """Dashes inside inline code spans should be preserved."""
         input_text = "Use `a--b` for ranges.\n"
         expected = "Use `a--b` for ranges.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_inline_code_double_backtick(self):
@@ -98,20 +102,20 @@ class TestDashConversionPreserved:
         """
         input_text = "Use ``a---b`` for dashes.\n"
         expected = "Use `a---b` for dashes.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_inline_code_with_surrounding_dashes(self):
         """Dashes outside inline code should convert, inside should not."""
         input_text = "before--`code--here`--after\n"
         expected = "before\u2013`code--here`\u2013after\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_thematic_break_preserved(self):
         """Thematic breaks (---) should not be converted."""
         input_text = "Above.\n\n---\n\nBelow.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         # mdformat renders thematic breaks; the break itself should remain
         assert "\u2014" not in result
         assert "\u2013" not in result
@@ -120,16 +124,14 @@ class TestDashConversionPreserved:
         """Frontmatter delimiters (---) should not be converted."""
         input_text = "---\ntitle: Test\n---\n\nContent with---em-dash.\n"
         expected = "---\ntitle: Test\n---\nContent with\u2014em-dash.\n"
-        result = mdformat.text(
-            input_text, extensions={"space_control", "frontmatter"}
-        )
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_code_block_with_language(self):
         """Code block with language specifier preserves dashes."""
         input_text = "Text.\n\n```python\nx = a--b\n```\n"
         expected = "Text.\n\n```python\nx = a--b\n```\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -139,14 +141,14 @@ class TestDashConversionEdgeCases:
     def test_four_dashes_unchanged(self):
         """Four or more dashes should not be converted."""
         input_text = "word----word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "\u2014" not in result
         assert "\u2013" not in result
 
     def test_five_dashes_unchanged(self):
         """Five dashes should not be converted."""
         input_text = "word-----word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "\u2014" not in result
         assert "\u2013" not in result
 
@@ -154,36 +156,36 @@ class TestDashConversionEdgeCases:
         """Single hyphen should not be affected."""
         input_text = "hyphen-ated word\n"
         expected = "hyphen-ated word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_line_of_only_dashes(self):
         """A line of only dashes should not be converted."""
         # Note: mdformat may interpret this as a thematic break
         input_text = "Above.\n\n----\n\nBelow.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "\u2014" not in result
         assert "\u2013" not in result
 
     def test_idempotency(self):
         """Running conversion twice should produce same result."""
         input_text = "word--word and word---word\n"
-        first_pass = mdformat.text(input_text, extensions={"space_control"})
-        second_pass = mdformat.text(first_pass, extensions={"space_control"})
+        first_pass = mdformat.text(input_text, extensions=_EXT)
+        second_pass = mdformat.text(first_pass, extensions=_EXT)
         assert first_pass == second_pass
 
     def test_already_unicode_en_dash(self):
         """Already-existing Unicode en-dash should pass through."""
         input_text = "word\u2013word\n"
         expected = "word\u2013word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_already_unicode_em_dash(self):
         """Already-existing Unicode em-dash should pass through."""
         input_text = "word\u2014word\n"
         expected = "word\u2014word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_dash_at_start_of_line(self):
@@ -192,28 +194,28 @@ class TestDashConversionEdgeCases:
         # Test within a paragraph context
         input_text = "Start.\n\nSo---yes.\n"
         expected = "Start.\n\nSo\u2014yes.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_dashes_in_list_item(self):
         """Dashes inside list item content should convert."""
         input_text = "- Item with--en-dash\n- Item with---em-dash\n"
         expected = "- Item with\u2013en-dash\n- Item with\u2014em-dash\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_dashes_in_blockquote(self):
         """Dashes inside blockquotes should convert."""
         input_text = "> The result---was clear.\n"
         expected = "> The result\u2014was clear.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_dashes_in_heading(self):
         """Dashes inside headings should convert."""
         input_text = "# Title---Subtitle\n"
         expected = "# Title\u2014Subtitle\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -332,7 +334,7 @@ class TestDashConversionHTML:
     def test_single_line_html_comment(self):
         """Single-line HTML comment should be preserved."""
         input_text = "<!-- comment -->\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "<!--" in result
         assert "-->" in result
         assert "\u2013" not in result
@@ -341,7 +343,7 @@ class TestDashConversionHTML:
     def test_triple_dash_comment(self):
         """Triple-dash HTML comment should be preserved."""
         input_text = "<!--- comment --->\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "<!---" in result
         assert "--->" in result
         assert "\u2014" not in result
@@ -349,13 +351,13 @@ class TestDashConversionHTML:
     def test_block_level_html_comment(self):
         """Block-level HTML comment (own paragraph) should be preserved."""
         input_text = "Text.\n\n<!-- block comment -->\n\nMore text.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "<!-- block comment -->" in result
 
     def test_inline_html_comment_with_dashes(self):
         """Dashes outside HTML comment convert; comment preserved."""
         input_text = "Text--here <!-- comment --> more---text.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "<!-- comment -->" in result
         assert "\u2013" in result  # en-dash from --
         assert "\u2014" in result  # em-dash from ---
@@ -363,25 +365,25 @@ class TestDashConversionHTML:
     def test_multi_line_html_comment(self):
         """Multi-line HTML comment should be preserved."""
         input_text = "Text.\n\n<!--\ncomment with--dashes\n-->\n\nMore text.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "\u2013" not in result
         assert "\u2014" not in result
 
     def test_html_tag_with_dash_attributes(self):
         """HTML tags with dash-containing attributes should be preserved."""
         input_text = '<div data-value="test--value">\n\nContent.\n\n</div>\n'
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert 'data-value="test--value"' in result
 
     def test_self_closing_tag_with_dashes(self):
         """Self-closing HTML tags with dashes should be preserved."""
         input_text = '<img alt="a--b" />\n'
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert 'alt="a--b"' in result
 
     def test_dashes_outside_html_still_convert(self):
         """Dashes outside HTML elements should still convert normally."""
         input_text = "word--word and word---word\n"
         expected = "word\u2013word and word\u2014word\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
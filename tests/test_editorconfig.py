@@ -1,52 +1,111 @@
 """Tests for EditorConfig integration."""
 
-import tempfile
+import os
+import shutil
 from pathlib import Path
 
 import mdformat
 import pytest
 
-from mdformat_space_control import set_current_file
+import mdformat_space_control.config
+from mdformat_space_control import (
+    clear_editorconfig_cache,
+    current_file,
+    get_current_file,
+    set_current_file,
+)
 
 
-@pytest.fixture
-def temp_project():
-    """Create a temporary project directory with .editorconfig."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+_EXT = frozenset({"space_control"})
+
+
+EDITORCONFIG_4SPACE = """
+root = true
+
+[*.md]
+indent_style = space
+indent_size = 4
+"""
+
+EDITORCONFIG_TAB = """
+root = true
+
+[*.md]
+indent_style = tab
+indent_size = 4
+"""
+
+EDITORCONFIG_TEMPLATES = {
+    "4space": EDITORCONFIG_4SPACE,
+    "tab": EDITORCONFIG_TAB,
+}
 
 
 def create_editorconfig(project_dir: Path, content: str) -> None:
     """Create an .editorconfig file in the project directory."""
     editorconfig_path = project_dir / ".editorconfig"
+    # Replace rather than overwrite, in case it is linked to a template
+    editorconfig_path.unlink(missing_ok=True)
     editorconfig_path.write_text(content)
 
 
+@pytest.fixture(scope="session")
+def link_editorconfig(tmp_path_factory):
+    """Return a helper that links a pre-written .editorconfig into a project.
+
+    Each template in EDITORCONFIG_TEMPLATES is written once per session and
+    hard-linked (or copied, where links are unsupported) into projects.
+    """
+    template_dir = tmp_path_factory.mktemp("ec")
+    for name, content in EDITORCONFIG_TEMPLATES.items():
+        (template_dir / f".editorconfig.{name}").write_text(content)
+
+    def link(project_dir: Path, template: str) -> None:
+        source = template_dir / f".editorconfig.{template}"
+        target = project_dir / ".editorconfig"
+        target.unlink(missing_ok=True)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+    return link
+
+
+@pytest.fixture(scope="module")
+def project_4space(tmp_path_factory, link_editorconfig):
+    """A shared project directory with a 4-space .editorconfig."""
+    project_dir = tmp_path_factory.mktemp("project_4space")
+    link_editorconfig(project_dir, "4space")
+    return project_dir
+
+
+@pytest.fixture(scope="module")
+def project_tab(tmp_path_factory, link_editorconfig):
+    """A shared project directory with a tab .editorconfig."""
+    project_dir = tmp_path_factory.mktemp("project_tab")
+    link_editorconfig(project_dir, "tab")
+    return project_dir
+
+
+@pytest.fixture(scope="module")
+def empty_project(tmp_path_factory):
+    """A shared project directory with no .editorconfig."""
+    return tmp_path_factory.mktemp("empty_project")
+
+
 def format_with_context(text: str, filepath: Path) -> str:
     """Format markdown text with file context set."""
-    set_current_file(filepath)
-    try:
-        return mdformat.text(text, extensions={"space_control"})
-    finally:
-        set_current_file(None)
+    with current_file(filepath):
+        return mdformat.text(text, extensions=_EXT)
 
 
 class TestFourSpaceIndent:
     """Tests for 4-space indentation."""
 
-    def test_bullet_list_nested(self, temp_project):
+    def test_bullet_list_nested(self, project_4space):
         """Nested bullet lists should use 4-space indentation."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         input_text = """\
 - Item 1
@@ -61,19 +120,9 @@ indent_size = 4
         result = format_with_context(input_text, md_file)
         assert result == expected
 
-    def test_bullet_list_continuation(self, temp_project):
+    def test_bullet_list_continuation(self, project_4space):
         """Continuation lines should use 4-space indentation."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         input_text = """\
 - Item 1
@@ -87,19 +136,9 @@ indent_size = 4
         result = format_with_context(input_text, md_file)
         assert result == expected
 
-    def test_ordered_list_nested(self, temp_project):
+    def test_ordered_list_nested(self, project_4space):
         """Nested ordered lists should use 4-space indentation."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         input_text = """\
 1. Item 1
@@ -118,19 +157,9 @@ indent_size = 4
 class TestTabIndent:
     """Tests for tab indentation."""
 
-    def test_bullet_list_with_tabs(self, temp_project):
+    def test_bullet_list_with_tabs(self, project_tab):
         """Bullet lists should use tab indentation when configured."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = tab
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_tab / "test.md"
 
         input_text = """\
 - Item 1
@@ -149,10 +178,9 @@ indent_size = 4
 class TestNoEditorConfig:
     """Tests for behavior when no .editorconfig is present."""
 
-    def test_passthrough_without_editorconfig(self, temp_project):
+    def test_passthrough_without_editorconfig(self, empty_project):
         """Without .editorconfig, use mdformat defaults (2 spaces)."""
-        # No .editorconfig file created
-        md_file = temp_project / "test.md"
+        md_file = empty_project / "test.md"
 
         input_text = """\
 - Item 1
@@ -172,21 +200,12 @@ class TestNoEditorConfig:
 class TestCwdFallback:
     """Tests for cwd-based fallback when no file context is set."""
 
-    def test_uses_cwd_editorconfig(self, temp_project, monkeypatch):
+    def test_uses_cwd_editorconfig(self, tmp_path, link_editorconfig, monkeypatch):
         """Without file context, should use .editorconfig from cwd."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
+        link_editorconfig(tmp_path, "4space")
 
-        # Change to temp_project directory
-        monkeypatch.chdir(temp_project)
+        # Change to tmp_path directory
+        monkeypatch.chdir(tmp_path)
 
         # Clear any existing file context
         set_current_file(None)
@@ -201,16 +220,15 @@ indent_size = 4
     - Nested item
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
-    def test_fallback_without_editorconfig(self, temp_project, monkeypatch):
+    def test_fallback_without_editorconfig(self, empty_project, tmp_path, monkeypatch):
         """Without .editorconfig in cwd or HOME, use mdformat defaults."""
-        # No .editorconfig file created in temp_project
-        monkeypatch.chdir(temp_project)
+        monkeypatch.chdir(empty_project)
 
         # Also isolate from real HOME ~/.editorconfig
-        fake_home = temp_project / "fake_home"
+        fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
         monkeypatch.setattr(Path, "home", lambda: fake_home)
 
@@ -227,29 +245,20 @@ indent_size = 4
   - Nested item
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
 class TestEditorConfigInheritance:
     """Tests for .editorconfig inheritance behavior."""
 
-    def test_reads_parent_editorconfig(self, temp_project):
+    def test_reads_parent_editorconfig(self, tmp_path, link_editorconfig):
         """Should read .editorconfig from parent directories."""
         # Create .editorconfig in parent
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
+        link_editorconfig(tmp_path, "4space")
 
         # Create subdirectory
-        subdir = temp_project / "docs"
+        subdir = tmp_path / "docs"
         subdir.mkdir()
         md_file = subdir / "test.md"
 
@@ -268,24 +277,17 @@ indent_size = 4
 class TestHomeFallback:
     """Tests for HOME ~/.editorconfig fallback."""
 
-    def test_home_fallback_when_cwd_outside_home(self, temp_project, monkeypatch):
+    def test_home_fallback_when_cwd_outside_home(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
         """Should use ~/.editorconfig when CWD has no .editorconfig and is outside HOME."""
         # Create a "fake home" directory with .editorconfig
-        fake_home = temp_project / "fake_home"
+        fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
-        create_editorconfig(
-            fake_home,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
+        link_editorconfig(fake_home, "4space")
 
         # Create a separate "app" directory with NO .editorconfig
-        app_dir = temp_project / "app"
+        app_dir = tmp_path / "app"
         app_dir.mkdir()
 
         # Monkeypatch Path.home() to return fake_home
@@ -308,27 +310,20 @@ indent_size = 4
     - Nested item
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
-    def test_no_fallback_when_explicit_file_set(self, temp_project, monkeypatch):
+    def test_no_fallback_when_explicit_file_set(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
         """Should NOT use HOME fallback when explicit file context is set."""
         # Create a "fake home" with 4-space .editorconfig
-        fake_home = temp_project / "fake_home"
+        fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
-        create_editorconfig(
-            fake_home,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
+        link_editorconfig(fake_home, "4space")
 
         # Create a project directory with NO .editorconfig
-        project_dir = temp_project / "project"
+        project_dir = tmp_path / "project"
         project_dir.mkdir()
 
         # Monkeypatch Path.home() to return fake_home
@@ -349,14 +344,14 @@ indent_size = 4
         result = format_with_context(input_text, project_dir / "test.md")
         assert result == expected
 
-    def test_no_fallback_when_home_editorconfig_missing(self, temp_project, monkeypatch):
+    def test_no_fallback_when_home_editorconfig_missing(self, tmp_path, monkeypatch):
         """Should use defaults when HOME has no .editorconfig."""
         # Create a "fake home" with NO .editorconfig
-        fake_home = temp_project / "fake_home"
+        fake_home = tmp_path / "fake_home"
         fake_home.mkdir()
 
         # Create a separate "app" directory with NO .editorconfig
-        app_dir = temp_project / "app"
+        app_dir = tmp_path / "app"
         app_dir.mkdir()
 
         # Monkeypatch Path.home() to return fake_home
@@ -379,26 +374,16 @@ indent_size = 4
   - Nested item
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
 class TestTightListWithCustomIndent:
     """Integration tests for tight lists with custom indentation."""
 
-    def test_tight_list_with_4space(self, temp_project):
+    def test_tight_list_with_4space(self, project_4space):
         """Tight lists should work with 4-space indentation."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         # Loose list input should become tight
         input_text = """\
@@ -416,19 +401,9 @@ indent_size = 4
         result = format_with_context(input_text, md_file)
         assert result == expected
 
-    def test_multi_paragraph_with_custom_indent(self, temp_project):
+    def test_multi_paragraph_with_custom_indent(self, project_4space):
         """Multi-paragraph items should use custom indentation."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         input_text = """\
 - First item with multiple paragraphs
@@ -447,19 +422,9 @@ indent_size = 4
         result = format_with_context(input_text, md_file)
         assert result == expected
 
-    def test_nested_with_multi_paragraph(self, temp_project):
+    def test_nested_with_multi_paragraph(self, project_4space):
         """Nested lists with multi-paragraph items and custom indent."""
-        create_editorconfig(
-            temp_project,
-            """
-root = true
-
-[*.md]
-indent_style = space
-indent_size = 4
-""",
-        )
-        md_file = temp_project / "test.md"
+        md_file = project_4space / "test.md"
 
         input_text = """\
 - Outer item
@@ -488,52 +453,243 @@ indent_size = 4
 class TestEditorConfigDebug:
     """Tests documenting EditorConfig resolution behavior."""
 
-    def test_cwd_differs_from_file_location(self, temp_project, monkeypatch):
+    def test_cwd_differs_from_file_location(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
         """When CWD differs from file location, explicit file context wins."""
+        link_editorconfig(tmp_path, "4space")
+
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        monkeypatch.chdir(other_dir)
+
+        md_file = tmp_path / "doc.md"
+        result = format_with_context("- A\n  - B\n", md_file)
+        assert "    - B" in result  # 4-space indent
+
+    def test_obsidian_scenario_no_file_context(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
+        """Document behavior when no file context is set (Obsidian-like)."""
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        link_editorconfig(vault, "4space")
+
+        app_dir = tmp_path / "app"
+        app_dir.mkdir()
+        monkeypatch.chdir(app_dir)
+
+        fake_home = tmp_path / "fake_home"
+        fake_home.mkdir()
+        monkeypatch.setattr(Path, "home", lambda: fake_home)
+
+        set_current_file(None)
+
+        # Without file context, vault's .editorconfig is NOT found
+        result = mdformat.text("- A\n  - B\n", extensions=_EXT)
+        assert "  - B" in result  # 2-space default
+
+
+class TestEditorConfigCache:
+    """Tests for the per-directory .editorconfig parse cache."""
+
+    def test_modified_editorconfig_is_reparsed(self, tmp_path, link_editorconfig):
+        """Changes to a cached .editorconfig should be picked up."""
+        link_editorconfig(tmp_path, "4space")
+        md_file = tmp_path / "test.md"
+        assert "    - B" in format_with_context("- A\n  - B\n", md_file)
+
         create_editorconfig(
-            temp_project,
+            tmp_path,
             """
 root = true
 
 [*.md]
+indent_style = tab
+""",
+        )
+        assert "\t- B" in format_with_context("- A\n  - B\n", md_file)
+
+    def test_cached_editorconfig_is_parsed_once(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
+        """An unchanged .editorconfig is parsed once until changed or cleared."""
+        parse_calls = []
+        original_parse = mdformat_space_control.config._parse_editorconfig
+
+        def counting_parse(text):
+            parse_calls.append(text)
+            return original_parse(text)
+
+        monkeypatch.setattr(
+            mdformat_space_control.config, "_parse_editorconfig", counting_parse
+        )
+        link_editorconfig(tmp_path, "4space")
+        subdir = tmp_path / "docs"
+        subdir.mkdir()
+
+        for md_file in (tmp_path / "a.md", tmp_path / "b.md", subdir / "c.md"):
+            format_with_context("- A\n  - B\n", md_file)
+        assert len(parse_calls) == 1
+
+        clear_editorconfig_cache()
+        format_with_context("- A\n  - B\n", tmp_path / "a.md")
+        assert len(parse_calls) == 2
+
+        create_editorconfig(tmp_path, EDITORCONFIG_TAB)
+        format_with_context("- A\n  - B\n", tmp_path / "a.md")
+        assert len(parse_calls) == 3
+
+    def test_clear_editorconfig_cache(self, tmp_path, link_editorconfig):
+        """Clearing the cache should not change formatting results."""
+        link_editorconfig(tmp_path, "4space")
+        md_file = tmp_path / "test.md"
+        first = format_with_context("- A\n  - B\n", md_file)
+        clear_editorconfig_cache()
+        assert format_with_context("- A\n  - B\n", md_file) == first
+
+    def test_section_globs_and_precedence(self, tmp_path):
+        """Closer files and later sections take precedence; globs are honored."""
+        create_editorconfig(
+            tmp_path,
+            """
+root = true
+
+[*]
+indent_style = tab
+
+[*.{md,markdown}]
+indent_style = space
+indent_size = 3
+""",
+        )
+        subdir = tmp_path / "docs"
+        subdir.mkdir()
+        create_editorconfig(
+            subdir,
+            """
+  [*.md]
+  indent_size = 4  ; inline comment
+""",
+        )
+        assert "   - B" in format_with_context("- A\n  - B\n", tmp_path / "a.md")
+        assert "    - B" in format_with_context("- A\n  - B\n", subdir / "a.md")
+        assert "\t- B" in format_with_context("- A\n  - B\n", subdir / "a.txt")
+
+    def test_new_editorconfig_found_in_same_tree(self, tmp_path, link_editorconfig):
+        """A .editorconfig added above an already-walked directory is picked up."""
+        project = tmp_path / "proj"
+        notes = project / "notes"
+        notes.mkdir(parents=True)
+        assert "  - B" in format_with_context("- A\n    - B\n", notes / "a.md")
+
+        link_editorconfig(project, "4space")
+        assert "    - B" in format_with_context("- A\n  - B\n", notes / "b.md")
+
+    def test_new_editorconfig_found_with_cwd_fallback(
+        self, tmp_path, link_editorconfig, monkeypatch
+    ):
+        """Without file context, a newly added cwd .editorconfig is picked up."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "fake_home")
+        assert "  - B" in mdformat.text("- A\n    - B\n", extensions=_EXT)
+
+        link_editorconfig(tmp_path, "4space")
+        assert "    - B" in mdformat.text("- A\n  - B\n", extensions=_EXT)
+
+
+class TestSectionGlobs:
+    """Tests for EditorConfig section glob matching."""
+
+    @pytest.mark.parametrize(
+        "glob,relpath,matches",
+        [
+            ("*.md", "test.md", True),
+            ("*.md", "docs/test.md", True),
+            ("*.{md,{markdown,mdown}}", "test.mdown", True),
+            ("*.{txt,rst}", "test.md", False),
+            ("docs/*.md", "docs/test.md", True),
+            ("docs/*.md", "docs/sub/test.md", False),
+            ("docs/**.md", "docs/sub/test.md", True),
+            ("/test.md", "test.md", True),
+            ("[!t]*.md", "test.md", False),
+            ("chapter{1..3}.md", "chapter2.md", True),
+            ("chapter{1..3}.md", "chapter4.md", False),
+            ("chapter{1..3000000}.md", "chapter2999999.md", True),
+            ("chapter{1..3000000}.md", "chapter3000001.md", False),
+            ("[z-a].md", "a.md", False),
+            ("[[:alpha:]].md", "a.md", False),
+            ("[a&&b|~c].md", "&.md", True),
+        ],
+    )
+    def test_glob(self, tmp_path, glob, relpath, matches):
+        """Section globs should follow EditorConfig wildcard semantics."""
+        create_editorconfig(
+            tmp_path,
+            f"""
+root = true
+
+[{glob}]
 indent_style = space
 indent_size = 4
 """,
         )
+        md_file = tmp_path / relpath
+        result = format_with_context("- A\n  - B\n", md_file)
+        assert ("    - B" in result) == matches
 
-        other_dir = temp_project / "other"
-        other_dir.mkdir()
-        monkeypatch.chdir(other_dir)
 
-        md_file = temp_project / "doc.md"
-        result = format_with_context("- A\n  - B\n", md_file)
-        assert "    - B" in result  # 4-space indent
+class TestCurrentFileContext:
+    """Tests for the current_file() context manager."""
 
-    def test_obsidian_scenario_no_file_context(self, temp_project, monkeypatch):
-        """Document behavior when no file context is set (Obsidian-like)."""
-        vault = temp_project / "vault"
-        vault.mkdir()
+    def test_restores_previous_file(self, tmp_path):
+        """Leaving the block restores the previously set file."""
+        outer = tmp_path / "outer.md"
+        inner = tmp_path / "inner.md"
+        with current_file(outer):
+            with current_file(inner):
+                assert get_current_file() == inner.resolve()
+            assert get_current_file() == outer.resolve()
+        assert get_current_file() is None
+
+
+class TestEditorConfigParsing:
+    """Tests for .editorconfig file parsing semantics."""
+
+    def test_repeated_section_keeps_file_order(self, tmp_path):
+        """A repeated section header applies at its own position in the file."""
         create_editorconfig(
-            vault,
+            tmp_path,
             """
 root = true
 
 [*.md]
-indent_style = space
 indent_size = 4
+
+[*]
+indent_size = 2
+
+[*.md]
+indent_size = 8
 """,
         )
+        result = format_with_context("- A\n  - B\n", tmp_path / "test.md")
+        assert "        - B" in result
 
-        app_dir = temp_project / "app"
-        app_dir.mkdir()
-        monkeypatch.chdir(app_dir)
-
-        fake_home = temp_project / "fake_home"
-        fake_home.mkdir()
-        monkeypatch.setattr(Path, "home", lambda: fake_home)
+    def test_default_section_is_not_inherited(self, tmp_path):
+        """A [DEFAULT] section is an ordinary glob, not defaults for every section."""
+        create_editorconfig(
+            tmp_path,
+            """
+root = true
 
-        set_current_file(None)
+[DEFAULT]
+indent_size = 8
 
-        # Without file context, vault's .editorconfig is NOT found
-        result = mdformat.text("- A\n  - B\n", extensions={"space_control"})
-        assert "  - B" in result  # 2-space default
+[*.md]
+indent_style = space
+""",
+        )
+        result = format_with_context("- A\n  - B\n", tmp_path / "test.md")
+        assert "  - B" in result
+        assert "   - B" not in result
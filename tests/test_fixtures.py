@@ -4,6 +4,9 @@ from markdown_it.utils import read_fixture_file
 import mdformat
 import pytest
 
+
+_EXT = frozenset({"space_control"})
+
 FIXTURE_PATH = Path(__file__).parent / "fixtures.md"
 fixtures = read_fixture_file(FIXTURE_PATH)
 
@@ -12,6 +15,6 @@ fixtures = read_fixture_file(FIXTURE_PATH)
     "line,title,text,expected", fixtures, ids=[f[1] for f in fixtures]
 )
 def test_fixtures(line, title, text, expected):
-    output = mdformat.text(text, extensions={"space_control"})
+    output = mdformat.text(text, extensions=_EXT)
     print(output)
     assert output.rstrip() == expected.rstrip(), output
@@ -1,33 +1,36 @@
 """Tests for YAML frontmatter spacing normalization."""
 
+import functools
+
 import mdformat
 import pytest
 
 
-class TestFrontmatterHeadingSpacing:
-    """Tests for frontmatter followed by heading (no blank line)."""
+_EXT_FM = frozenset({"space_control", "frontmatter"})
 
-    def test_frontmatter_heading_removes_blank_line(self):
-        """Frontmatter followed by heading should have no blank line."""
-        input_text = """\
+
+@pytest.fixture(scope="session")
+def mdformat_fn():
+    """Formatter with the space_control and frontmatter extensions enabled."""
+    return functools.partial(mdformat.text, extensions=_EXT_FM)
+
+
+# Frontmatter followed by heading: no blank line
+HEADING_REMOVES_BLANK_LINE_INPUT = """\
 ---
 title: Test
 ---
 
 # Heading
 """
-        expected = """\
+HEADING_REMOVES_BLANK_LINE_EXPECTED = """\
 ---
 title: Test
 ---
 # Heading
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_frontmatter_heading_multiple_blank_lines(self):
-        """Multiple blank lines between frontmatter and heading should be removed."""
-        input_text = """\
+HEADING_MULTIPLE_BLANK_LINES_INPUT = """\
 ---
 title: Test
 ---
@@ -36,58 +39,43 @@ title: Test
 
 # Heading
 """
-        expected = """\
+HEADING_MULTIPLE_BLANK_LINES_EXPECTED = """\
 ---
 title: Test
 ---
 # Heading
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_frontmatter_h2_heading(self):
-        """Works with any heading level."""
-        input_text = """\
+H2_HEADING_INPUT = """\
 ---
 title: Test
 ---
 
 ## Second Level Heading
 """
-        expected = """\
+H2_HEADING_EXPECTED = """\
 ---
 title: Test
 ---
 ## Second Level Heading
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
-
 
-class TestFrontmatterNonHeadingSpacing:
-    """Tests for frontmatter followed by non-heading content (tight spacing)."""
-
-    def test_frontmatter_paragraph_tight(self):
-        """Frontmatter followed by paragraph should have no blank line (tight)."""
-        input_text = """\
+# Frontmatter followed by non-heading content: tight spacing
+PARAGRAPH_TIGHT_INPUT = """\
 ---
 title: Test
 ---
 
 This is a paragraph.
 """
-        expected = """\
+PARAGRAPH_TIGHT_EXPECTED = """\
 ---
 title: Test
 ---
 This is a paragraph.
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_frontmatter_paragraph_multiple_blank_lines(self):
-        """Multiple blank lines between frontmatter and paragraph should be removed."""
-        input_text = """\
+PARAGRAPH_MULTIPLE_BLANK_LINES_INPUT = """\
 ---
 title: Test
 ---
@@ -96,18 +84,14 @@ title: Test
 
 This is a paragraph.
 """
-        expected = """\
+PARAGRAPH_MULTIPLE_BLANK_LINES_EXPECTED = """\
 ---
 title: Test
 ---
 This is a paragraph.
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_frontmatter_list(self):
-        """Frontmatter followed by list should have no blank line (tight)."""
-        input_text = """\
+LIST_INPUT = """\
 ---
 title: Test
 ---
@@ -115,19 +99,15 @@ title: Test
 - Item 1
 - Item 2
 """
-        expected = """\
+LIST_EXPECTED = """\
 ---
 title: Test
 ---
 - Item 1
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_frontmatter_code_block(self):
-        """Frontmatter followed by code block should have no blank line (tight)."""
-        input_text = """\
+CODE_BLOCK_INPUT = """\
 ---
 title: Test
 ---
@@ -136,7 +116,7 @@ title: Test
 print("hello")
 ```
 """
-        expected = """\
+CODE_BLOCK_EXPECTED = """\
 ---
 title: Test
 ---
@@ -144,52 +124,34 @@ title: Test
 print("hello")
 ```
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-
-class TestNoFrontmatter:
-    """Tests for documents without frontmatter (unchanged behavior)."""
-
-    def test_no_frontmatter_unchanged(self):
-        """Documents without frontmatter should be unchanged."""
-        input_text = """\
+# Documents without frontmatter are unchanged
+NO_FRONTMATTER_INPUT = """\
 # Heading
 
 This is a paragraph.
 """
-        expected = """\
+NO_FRONTMATTER_EXPECTED = """\
 # Heading
 
 This is a paragraph.
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
 
-    def test_no_frontmatter_list(self):
-        """Lists in documents without frontmatter should be unchanged."""
-        input_text = """\
+NO_FRONTMATTER_LIST_INPUT = """\
 # Heading
 
 - Item 1
 - Item 2
 """
-        expected = """\
+NO_FRONTMATTER_LIST_EXPECTED = """\
 # Heading
 
 - Item 1
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
-
-
-class TestComplexFrontmatter:
-    """Tests for complex frontmatter content."""
 
-    def test_multiline_frontmatter(self):
-        """Complex multiline frontmatter should work correctly."""
-        input_text = """\
+# Complex multiline frontmatter
+MULTILINE_FRONTMATTER_INPUT = """\
 ---
 title: My Document
 author: John Doe
@@ -200,7 +162,7 @@ tags:
 
 # Introduction
 """
-        expected = """\
+MULTILINE_FRONTMATTER_EXPECTED = """\
 ---
 title: My Document
 author: John Doe
@@ -210,8 +172,50 @@ tags:
 ---
 # Introduction
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
-        assert result == expected
+
+
+FRONTMATTER_CASES = [
+    # Frontmatter followed by heading: no blank line
+    pytest.param(
+        HEADING_REMOVES_BLANK_LINE_INPUT,
+        HEADING_REMOVES_BLANK_LINE_EXPECTED,
+        id="heading-removes-blank-line",
+    ),
+    pytest.param(
+        HEADING_MULTIPLE_BLANK_LINES_INPUT,
+        HEADING_MULTIPLE_BLANK_LINES_EXPECTED,
+        id="heading-multiple-blank-lines",
+    ),
+    pytest.param(H2_HEADING_INPUT, H2_HEADING_EXPECTED, id="h2-heading"),
+    # Frontmatter followed by non-heading content: tight spacing
+    pytest.param(PARAGRAPH_TIGHT_INPUT, PARAGRAPH_TIGHT_EXPECTED, id="paragraph-tight"),
+    pytest.param(
+        PARAGRAPH_MULTIPLE_BLANK_LINES_INPUT,
+        PARAGRAPH_MULTIPLE_BLANK_LINES_EXPECTED,
+        id="paragraph-multiple-blank-lines",
+    ),
+    pytest.param(LIST_INPUT, LIST_EXPECTED, id="list"),
+    pytest.param(CODE_BLOCK_INPUT, CODE_BLOCK_EXPECTED, id="code-block"),
+    # Documents without frontmatter are unchanged
+    pytest.param(NO_FRONTMATTER_INPUT, NO_FRONTMATTER_EXPECTED, id="no-frontmatter"),
+    pytest.param(
+        NO_FRONTMATTER_LIST_INPUT,
+        NO_FRONTMATTER_LIST_EXPECTED,
+        id="no-frontmatter-list",
+    ),
+    # Complex multiline frontmatter
+    pytest.param(
+        MULTILINE_FRONTMATTER_INPUT,
+        MULTILINE_FRONTMATTER_EXPECTED,
+        id="multiline-frontmatter",
+    ),
+]
+
+
+@pytest.mark.parametrize("input_text,expected", FRONTMATTER_CASES)
+def test_frontmatter_roundtrip(input_text, expected, mdformat_fn):
+    """Blank lines after frontmatter are removed; other documents are unchanged."""
+    assert mdformat_fn(input_text) == expected
 
 
 class TestThematicBreakNotFrontmatter:
@@ -240,7 +244,7 @@ Some content here.
 
 ## Section Heading
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_thematic_break_multiple_blank_lines(self):
@@ -261,7 +265,7 @@ Content.
 
 ## Heading
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_thematic_break_paragraph_preserves_blank_line(self):
@@ -280,7 +284,7 @@ Before.
 
 After.
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_no_frontmatter_thematic_break_only(self):
@@ -299,7 +303,7 @@ After.
 
 ## Section
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_frontmatter_and_thematic_break(self):
@@ -329,7 +333,7 @@ Content here.
 
 ## Second Section
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
 
@@ -354,7 +358,7 @@ title: Tasks
 - Item 1
 - Item 2
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_frontmatter_checkbox_list(self):
@@ -375,5 +379,5 @@ title: Todo
 - [ ] Task 1
 - [x] Task 2
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
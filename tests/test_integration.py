@@ -9,6 +9,7 @@ These tests combine multiple features to catch conjunctive regressions:
 
 import importlib.util
 import tempfile
+from collections.abc import Set as AbstractSet
 from pathlib import Path
 
 import mdformat
@@ -17,12 +18,16 @@ import pytest
 from mdformat_space_control import set_current_file
 
 
+_EXT = frozenset({"space_control"})
+_EXT_FM = frozenset({"space_control", "frontmatter"})
+
+
 def format_with_editorconfig(
-    text: str, filepath: Path, extensions: set[str] | None = None
+    text: str, filepath: Path, extensions: AbstractSet[str] | None = None
 ) -> str:
     """Format markdown text with EditorConfig file context set."""
     if extensions is None:
-        extensions = {"space_control"}
+        extensions = _EXT
     set_current_file(filepath)
     try:
         return mdformat.text(text, extensions=extensions)
@@ -156,9 +161,7 @@ title: Test Document
 
 - Item three
 """
-        result = mdformat.text(
-            input_md, extensions={"space_control", "frontmatter"}
-        )
+        result = mdformat.text(input_md, extensions=_EXT_FM)
         assert result == expected
 
     def test_frontmatter_paragraph_then_tight_list(self):
@@ -193,9 +196,7 @@ Some introductory text.
 - Item 2
 - Item 3
 """
-        result = mdformat.text(
-            input_md, extensions={"space_control", "frontmatter"}
-        )
+        result = mdformat.text(input_md, extensions=_EXT_FM)
         assert result == expected
 
 
@@ -238,7 +239,7 @@ class TestIntegrationComplexNesting:
   - Level 2 under loose parent
     - Level 3 under loose grandparent
 """
-        result = mdformat.text(input_md, extensions={"space_control"})
+        result = mdformat.text(input_md, extensions=_EXT)
         assert result == expected
 
     def test_ordered_bullet_interleaved_nesting(self):
@@ -265,7 +266,7 @@ class TestIntegrationComplexNesting:
   2. Nested ordered two
     - Deep bullet
 """
-        result = mdformat.text(input_md, extensions={"space_control"})
+        result = mdformat.text(input_md, extensions=_EXT)
         assert result == expected
 
 
@@ -393,9 +394,7 @@ test: true
 - Content
 -
 """
-        result = mdformat.text(
-            input_md, extensions={"space_control", "frontmatter"}
-        )
+        result = mdformat.text(input_md, extensions=_EXT_FM)
         # Verify it doesn't crash and basic structure is preserved
         assert "---\n# List" in result
         assert "- Content" in result
@@ -3,6 +3,10 @@
 import pytest
 import mdformat
 
+
+_EXT = frozenset({"space_control"})
+_EXT_FM = frozenset({"space_control", "frontmatter"})
+
 try:
     import mdformat_simple_breaks
 
@@ -18,7 +22,7 @@ class TestSpaceControlAlone:
         """Verify basic tight list works."""
         input_text = "- Item 1\n\n- Item 2\n"
         expected = "- Item 1\n- Item 2\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -28,9 +32,7 @@ class TestWithFrontmatter:
     def test_frontmatter_heading_spacing(self):
         """Frontmatter + heading spacing works."""
         input_text = "---\ntitle: Test\n---\n\n# Heading\n"
-        result = mdformat.text(
-            input_text, extensions={"space_control", "frontmatter"}
-        )
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert "---\n# Heading" in result
 
 
@@ -45,50 +47,50 @@ class TestBuiltinWikilinks:
     def test_basic_wikilink_preserved(self):
         """Basic wikilinks should be preserved."""
         input_text = "Link to [[Note]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note]]" in result
 
     def test_wikilink_with_alias_preserved(self):
         """Wikilinks with aliases should be preserved."""
         input_text = "Link to [[Note|my alias]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note|my alias]]" in result
 
     def test_wikilink_with_heading_preserved(self):
         """Wikilinks with heading references should be preserved."""
         input_text = "Link to [[Note#Section]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note#Section]]" in result
 
     def test_wikilink_with_block_ref_preserved(self):
         """Wikilinks with block references should be preserved."""
         input_text = "Link to [[Note#^blockid]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note#^blockid]]" in result
 
     def test_embed_preserved(self):
         """Embed syntax ![[...]] should be preserved."""
         input_text = "Embed: ![[image.jpg]]\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "![[image.jpg]]" in result
 
     def test_embed_with_alias_preserved(self):
         """Embeds with aliases should be preserved."""
         input_text = "Embed: ![[image.jpg|caption]]\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "![[image.jpg|caption]]" in result
 
     def test_wikilinks_in_list(self):
         """Wikilinks in lists should be preserved."""
         input_text = "- [[Note]]\n- [[Other|alias]]\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note]]" in result
         assert "[[Other|alias]]" in result
 
     def test_wikilink_in_markdown_link_text(self):
         """Wikilinks inside markdown link text should not be duplicated."""
         input_text = "[![[image.jpg]]](http://example.com)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == "[![[image.jpg]]](http://example.com)\n"
         # Critical: no duplication
         assert result.count("[[image.jpg]]") == 1
@@ -96,27 +98,27 @@ class TestBuiltinWikilinks:
     def test_wikilink_formatting_is_idempotent(self):
         """Multiple format passes should produce identical output."""
         input_text = "[![[nested.jpg]]](http://example.com)\n"
-        result1 = mdformat.text(input_text, extensions={"space_control"})
-        result2 = mdformat.text(result1, extensions={"space_control"})
-        result3 = mdformat.text(result2, extensions={"space_control"})
+        result1 = mdformat.text(input_text, extensions=_EXT)
+        result2 = mdformat.text(result1, extensions=_EXT)
+        result3 = mdformat.text(result2, extensions=_EXT)
         assert result1 == result2 == result3
 
     def test_same_page_heading_link(self):
         """Same-page heading links should be preserved."""
         input_text = "Jump to [[#Section]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[#Section]]" in result
 
     def test_same_page_block_ref(self):
         """Same-page block references should be preserved."""
         input_text = "See [[#^blockid]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[#^blockid]]" in result
 
     def test_complex_wikilink(self):
         """Complex wikilink with heading, block ref, and alias."""
         input_text = "See [[Note#Section#^blockid|alias]].\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert "[[Note#Section#^blockid|alias]]" in result
 
 
@@ -4,6 +4,10 @@ import mdformat
 import pytest
 
 
+_EXT = frozenset({"space_control"})
+_EXT_FM = frozenset({"space_control", "frontmatter"})
+
+
 class TestTrailingWhitespace:
     """Tests for trailing whitespace removal.
 
@@ -15,21 +19,21 @@ class TestTrailingWhitespace:
         """Paragraph with trailing spaces should be stripped."""
         input_text = "This is a paragraph.   \n"
         expected = "This is a paragraph.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_heading_trailing_spaces_stripped(self):
         """Heading with trailing spaces should be stripped."""
         input_text = "# Heading   \n\nContent here.\n"
         expected = "# Heading\n\nContent here.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_list_item_trailing_spaces_stripped(self):
         """List item with trailing spaces should be stripped."""
         input_text = "- Item 1   \n- Item 2  \n"
         expected = "- Item 1\n- Item 2\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_code_block_content_preserved(self):
@@ -46,7 +50,7 @@ def foo():
     return "bar"
 ```
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_tilde_code_block_content_preserved(self):
@@ -67,7 +71,7 @@ code content
 more code
 ```
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_blockquote_stripped(self):
@@ -75,7 +79,7 @@ more code
         # mdformat normalizes blockquotes during rendering
         input_text = "> Quote content\n"
         expected = "> Quote content\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_multiple_lines_mixed(self):
@@ -106,7 +110,7 @@ code
 
 > Blockquote
 """
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -122,21 +126,21 @@ class TestHardBreaks:
         # mdformat converts two-space hard breaks to backslash style
         input_text = "Line one  \nLine two\n"
         expected = "Line one\\\nLine two\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_backslash_hard_break_preserved(self):
         """Backslash hard break should be preserved."""
         input_text = "Line one\\\nLine two\n"
         expected = "Line one\\\nLine two\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_multiple_hard_breaks(self):
         """Multiple hard breaks in sequence."""
         input_text = "Line one\\\nLine two\\\nLine three\n"
         expected = "Line one\\\nLine two\\\nLine three\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -151,28 +155,28 @@ class TestPseudoHeadingSpacing:
         """Bold pseudo-heading before list should have blank line."""
         input_text = "**Important:**\n- Item 1\n- Item 2\n"
         expected = "**Important:**\n\n- Item 1\n- Item 2\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_italic_pseudo_heading_before_list(self):
         """Italic pseudo-heading before list should have blank line."""
         input_text = "*Note:*\n- Item 1\n- Item 2\n"
         expected = "*Note:*\n\n- Item 1\n- Item 2\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_already_has_blank_line(self):
         """Already having blank line should remain unchanged."""
         input_text = "Some text.\n\n- Item 1\n- Item 2\n"
         expected = "Some text.\n\n- Item 1\n- Item 2\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_colon_pseudo_heading_before_list(self):
         """Colon-terminated pseudo-heading before list."""
         input_text = "Prerequisites:\n- Python 3.8+\n- pip\n"
         expected = "Prerequisites:\n\n- Python 3.8+\n- pip\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -187,21 +191,21 @@ class TestNormalLinks:
         """Normal links should be preserved unchanged."""
         input_text = "[normal link](https://example.com)\n"
         expected = "[normal link](https://example.com)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_link_in_paragraph(self):
         """Links in paragraphs should work correctly."""
         input_text = "Check out [this link](https://example.com) for more info.\n"
         expected = "Check out [this link](https://example.com) for more info.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_multiple_links(self):
         """Multiple links in content should work correctly."""
         input_text = "[link1](url1) and [link2](url2)\n"
         expected = "[link1](url1) and [link2](url2)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -212,28 +216,28 @@ class TestEscapedLinkRepair:
         """Remove newlines immediately after escaped opening bracket."""
         input_text = "[\n\ntext](url)\n"
         expected = "[text](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_newlines_before_closing_bracket(self):
         """Remove newlines immediately before escaped closing bracket."""
         input_text = "[text\n\n](url)\n"
         expected = "[text](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_newlines_both_ends(self):
         """Remove newlines at both ends of link text."""
         input_text = "[\n\ntext\n\n](url)\n"
         expected = "[text](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_internal_newlines_preserved(self):
         """Internal newlines between content blocks should be preserved."""
         input_text = "[\n\nFirst paragraph.\n\nSecond paragraph.\n\n](url)\n"
         expected = "[First paragraph.\n\nSecond paragraph.](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_image_embed_in_link(self):
@@ -244,28 +248,28 @@ class TestEscapedLinkRepair:
         """
         input_text = "[![alt text](image.png)\n\nCaption\n\n](url)\n"
         expected = "[![alt text](image.png)\n\nCaption](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_normal_link_unchanged(self):
         """Valid links should not be affected."""
         input_text = "[normal link](url)\n"
         expected = "[normal link](url)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_multiple_links(self):
         """Multiple escaped links in same document."""
         input_text = "[\n\nfirst](url1) and [\n\nsecond](url2)\n"
         expected = "[first](url1) and [second](url2)\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_link_with_prefix_text(self):
         """Escaped link with text before it."""
         input_text = "Check this [\n\nlink](url) here.\n"
         expected = "Check this [link](url) here.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -287,21 +291,21 @@ class TestConsecutiveBlankLines:
         # This verifies the expected behavior - mdformat already handles this
         input_text = "First paragraph.\n\n\n\nSecond paragraph.\n"
         expected = "First paragraph.\n\nSecond paragraph.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_single_empty_line_unchanged(self):
         """Single empty line should remain unchanged."""
         input_text = "First.\n\nSecond.\n"
         expected = "First.\n\nSecond.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
     def test_code_block_preserved(self):
         """Empty lines inside code blocks should be preserved."""
         input_text = "Text.\n\n```\n\n\n\n\ncode\n\n\n\n\n```\n\nMore text.\n"
         expected = "Text.\n\n```\n\n\n\n\ncode\n\n\n\n\n```\n\nMore text.\n"
-        result = mdformat.text(input_text, extensions={"space_control"})
+        result = mdformat.text(input_text, extensions=_EXT)
         assert result == expected
 
 
@@ -398,7 +402,7 @@ title: Test
 
 Content.
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_all_features_combined(self):
@@ -441,7 +445,7 @@ code
 
 > Quote
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected
 
     def test_all_features_with_escaped_link(self):
@@ -483,5 +487,5 @@ See [this resource](https://example.com) for details.
 - First point
 - Second point
 """
-        result = mdformat.text(input_text, extensions={"space_control", "frontmatter"})
+        result = mdformat.text(input_text, extensions=_EXT_FM)
         assert result == expected